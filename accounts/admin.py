@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
 
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 from .models import CustomUser
@@ -9,11 +11,68 @@ class CustomUserAdmin(UserAdmin):
     add_form = CustomUserCreationForm
     form = CustomUserChangeForm
     model = CustomUser
-    list_display = ["username", "is_staff"]
-    fieldsets = UserAdmin.fieldsets + ((None, {"fields": ("bio", "profile_image")}),)
-    add_fieldsets = UserAdmin.add_fieldsets + (
-        (None, {"fields": ("bio", "profile_image")}),
+    list_display = ["username", "is_staff", "article_count"]
+    list_per_page = 50
+    fieldsets = (
+        (None, {"fields": ("username", "password")}),
+        (_("Personal info"), {"fields": ("first_name", "last_name", "email")}),
+        (
+            _("Permissions"),
+            {
+                "fields": (
+                    "is_active",
+                    "is_staff",
+                    "is_superuser",
+                    "groups",
+                    "user_permissions",
+                ),
+            },
+        ),
+        (_("Important dates"), {"fields": ("last_login", "date_joined")}),
+        (
+            _("Profile"),
+            {
+                "fields": (
+                    "bio",
+                    "profile_image",
+                    "x_link",
+                    "linkedin_link",
+                    "github_link",
+                    "website_link",
+                ),
+            },
+        ),
     )
+    add_fieldsets = (
+        (
+            None,
+            {
+                "classes": ("wide",),
+                "fields": ("username", "email", "password1", "password2"),
+            },
+        ),
+        (
+            _("Profile"),
+            {
+                "fields": (
+                    "bio",
+                    "profile_image",
+                    "x_link",
+                    "linkedin_link",
+                    "github_link",
+                    "website_link",
+                ),
+            },
+        ),
+    )
+
+    def get_queryset(self, request):
+        # Count articles in the changelist query instead of once per row
+        return super().get_queryset(request).annotate(_article_count=Count("article"))
+
+    @admin.display(description="Articles", ordering="_article_count")
+    def article_count(self, obj):
+        return obj._article_count
 
 
 admin.site.register(CustomUser, CustomUserAdmin)
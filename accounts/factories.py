@@ -0,0 +1,19 @@
+from .models import CustomUser
+
+
+def make_users(n, prefix="user"):
+    """Create ``n`` users in batched INSERTs for test fixtures.
+
+    Passwords are left unusable, which skips password hashing; tests that
+    log in should use ``Client.force_login``. Use ``create_user`` in tests
+    that exercise hashing itself.
+    """
+    users = [
+        CustomUser(
+            username=f"{prefix}{i}",
+            email=f"{prefix}{i}@example.com",
+            password="!",
+        )
+        for i in range(n)
+    ]
+    return CustomUser.objects.bulk_create(users, batch_size=500)
@@ -1,4 +1,8 @@
+import unicodedata
+
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
+from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
 from .models import CustomUser
 
 
@@ -12,6 +16,17 @@ class CustomUserCreationForm(UserCreationForm):
         model = CustomUser
         fields = ("first_name", "last_name", "username", "email")
 
+    def clean_email(self):
+        email = unicodedata.normalize("NFKC", self.cleaned_data["email"])
+        # Compare with LOWER(email) so the lookup uses user_email_ci_uniq
+        if email and (
+            CustomUser.objects.alias(email_lower=Lower("email"))
+            .filter(email_lower=email.lower())
+            .exists()
+        ):
+            raise ValidationError("A user with that email already exists.")
+        return email
+
 
 class CustomUserChangeForm(UserChangeForm):
     """Form for updating an existing user.
@@ -20,4 +35,13 @@ class CustomUserChangeForm(UserChangeForm):
     """
     class Meta:
         model = CustomUser
-        fields = ("first_name", "last_name", "username", "email", "bio", "profile_image", "x_link", "linkedin_link", "github_link", "website_link")
\ No newline at end of file
+        fields = ("first_name", "last_name", "username", "email", "bio", "profile_image", "x_link", "linkedin_link", "github_link", "website_link")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # UserChangeForm always declares these; drop any that Meta.fields
+        # doesn't ask for so the public edit page doesn't render them.
+        # The admin lists them in its fieldsets, so it keeps them.
+        for name in ("password", "groups", "user_permissions"):
+            if name not in self._meta.fields:
+                self.fields.pop(name, None)
@@ -0,0 +1,13 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2 hasher with lower memory and parallelism than Django's defaults.
+
+    64 MiB and two lanes keep signup and login fast on small instances
+    while staying above OWASP's recommended Argon2id minimums.
+    """
+
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 2
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-14 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_customuser_github_link_customuser_linkedin_link_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='avatar_thumb',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='profile_images/thumbs/'),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='profile_image_medium',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='profile_images/medium/'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.14 on 2026-10-14 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_customuser_avatar_thumb_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='github_link',
+            field=models.URLField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='linkedin_link',
+            field=models.URLField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='website_link',
+            field=models.URLField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='x_link',
+            field=models.URLField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('github_link__isnull', False)), fields=['id'], name='user_github_notnull_idx'),
+        ),
+    ]
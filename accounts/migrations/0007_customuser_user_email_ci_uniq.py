@@ -0,0 +1,40 @@
+# Generated by Django 5.0.14 on 2026-10-14 05:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def check_case_insensitive_duplicate_emails(apps, schema_editor):
+    """Fail with a readable message instead of an IntegrityError."""
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    duplicates = list(
+        CustomUser.objects.exclude(email="")
+        .values(email_lower=django.db.models.functions.text.Lower("email"))
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add user_email_ci_uniq: these emails are used by more than "
+            "one user (ignoring case). Merge or change them, then re-run "
+            "migrate: " + ", ".join(sorted(duplicates))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_alter_customuser_github_link_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_insensitive_duplicate_emails, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), condition=models.Q(('email', ''), _negated=True), name='user_email_ci_uniq', violation_error_message='A user with that email already exists.'),
+        ),
+    ]
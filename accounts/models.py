@@ -1,11 +1,83 @@
+from io import BytesIO
+from pathlib import Path
+
+from django.core.files.base import ContentFile
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
+from PIL import Image, ImageOps
+
+AVATAR_SIZE = (128, 128)
+PROFILE_IMAGE_MEDIUM_SIZE = (512, 512)
+
+
+def make_thumbnail(image, size):
+    """Return a square, WebP-encoded copy of ``image`` cropped to ``size``."""
+    image.open()
+    with Image.open(image) as img:
+        img = ImageOps.exif_transpose(img)
+        # WebP supports alpha, so keep transparency instead of flattening it.
+        img = img.convert("RGBA" if img.has_transparency_data else "RGB")
+        img = ImageOps.fit(img, size)
+    buffer = BytesIO()
+    img.save(buffer, format="WEBP", quality=80)
+    name = f"{Path(image.name).stem}_{size[0]}x{size[1]}.webp"
+    return ContentFile(buffer.getvalue(), name=name)
+
 
 class CustomUser(AbstractUser):
     bio = models.TextField(null=True, blank=True)
     profile_image = models.ImageField(upload_to='profile_images/', null=True, blank=True)
-    x_link = models.CharField(max_length=255, null=True, blank=True) 
-    linkedin_link = models.CharField(max_length=255, null=True, blank=True)
-    github_link = models.CharField(max_length=255, null=True, blank=True)
-    website_link = models.CharField(max_length=255, null=True, blank=True)
+    avatar_thumb = models.ImageField(upload_to='profile_images/thumbs/', null=True, blank=True, editable=False)
+    profile_image_medium = models.ImageField(upload_to='profile_images/medium/', null=True, blank=True, editable=False)
+    x_link = models.URLField(max_length=255, null=True, blank=True, db_index=True)
+    linkedin_link = models.URLField(max_length=255, null=True, blank=True, db_index=True)
+    github_link = models.URLField(max_length=255, null=True, blank=True, db_index=True)
+    website_link = models.URLField(max_length=255, null=True, blank=True, db_index=True)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Partial index: only the few users with a GitHub link are stored.
+            models.Index(
+                fields=["id"],
+                name="user_github_notnull_idx",
+                condition=models.Q(github_link__isnull=False),
+            ),
+        ]
+        constraints = [
+            # Case-insensitive unique email; blank emails are allowed to repeat.
+            models.UniqueConstraint(
+                Lower("email"),
+                name="user_email_ci_uniq",
+                condition=~models.Q(email=""),
+                violation_error_message="A user with that email already exists.",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Resize once at upload time so pages never serve the original file
+        # into small avatar slots.
+        previous = []
+        if self.profile_image and not self.profile_image._committed:
+            previous = [f for f in (self.avatar_thumb, self.profile_image_medium) if f]
+            self.avatar_thumb = make_thumbnail(self.profile_image, AVATAR_SIZE)
+            self.profile_image_medium = make_thumbnail(self.profile_image, PROFILE_IMAGE_MEDIUM_SIZE)
+        elif not self.profile_image:
+            previous = [f for f in (self.avatar_thumb, self.profile_image_medium) if f]
+            self.avatar_thumb = None
+            self.profile_image_medium = None
+        super().save(*args, **kwargs)
+        # Remove replaced variants, unless the storage overwrote them in place.
+        current = {self.avatar_thumb.name, self.profile_image_medium.name}
+        for old in previous:
+            if old.name not in current:
+                old.storage.delete(old.name)
+
+    @property
+    def avatar_url(self):
+        # Images uploaded before thumbnails existed fall back to the original.
+        return (self.avatar_thumb or self.profile_image).url
 
+    @property
+    def profile_image_medium_url(self):
+        return (self.profile_image_medium or self.profile_image).url
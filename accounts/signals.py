@@ -0,0 +1,52 @@
+import time
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from articles.models import Article, Comment
+
+
+def profile_articles_version_key(user_id):
+    return f"profile_articles_version:{user_id}"
+
+
+def get_profile_articles_version(user_id):
+    """Return the version used to key a user's cached profile article list."""
+    return cache.get_or_set(profile_articles_version_key(user_id), time.time_ns, None)
+
+
+def bump_profile_articles_version(user_id):
+    # A new version makes the profile page render fresh article fragments.
+    cache.set(profile_articles_version_key(user_id), time.time_ns(), None)
+
+
+@receiver([post_save, post_delete], sender=Article)
+def article_changed(sender, instance, **kwargs):
+    bump_profile_articles_version(instance.author_id)
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, **kwargs):
+    # Profile cards show comment counts, so comments invalidate them too.
+    # Views set comment.article before saving, so this is usually cached.
+    bump_profile_articles_version(instance.article.author_id)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, origin=None, **kwargs):
+    # Skip comments removed by a cascade, which would otherwise look up every
+    # comment's article one by one. For an article delete, article_changed
+    # already covers its author; after a user delete, other authors' counts
+    # refresh when their fragments expire.
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is not Comment:
+        return
+    author_id = (
+        Article.objects.filter(pk=instance.article_id)
+        .values_list("author_id", flat=True)
+        .first()
+    )
+    if author_id is not None:
+        bump_profile_articles_version(author_id)
@@ -1,6 +1,18 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
+from articles.models import Article, Category, Comment
+from .factories import make_users
 
 class UsersManagersTests(TestCase):
     def test_create_user(self):
@@ -16,6 +28,15 @@ class UsersManagersTests(TestCase):
         self.assertFalse(user.is_staff)
         self.assertFalse(user.is_superuser)
 
+    def test_password_hashed_with_argon2(self):
+        user = get_user_model().objects.create_user(
+            username="testuser",
+            email="testuser@gmail.com",
+            password="testpass1234",
+        )
+        self.assertTrue(user.password.startswith("argon2$"))
+        self.assertTrue(user.check_password("testpass1234"))
+
     def test_create_superuser(self):
         User = get_user_model()
         user = User.objects.create_superuser(
@@ -54,3 +75,266 @@ class SignupPageTests(TestCase):
         self.assertEqual(get_user_model().objects.all()[0].username, "testuser")
         self.assertEqual(get_user_model().objects.all()[0].email, "testuser@gmail.com")
 
+    def test_signup_form_rejects_duplicate_email_case_insensitively(self):
+        [existing] = make_users(1)
+        response = self.client.post(
+            reverse("signup"),
+            {
+                "username": "testuser",
+                "email": existing.email.upper(),
+                "password1": "testpass123",
+                "password2": "testpass123",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("email", response.context["form"].errors)
+        self.assertEqual(get_user_model().objects.count(), 1)
+
+
+class ProfilePageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        [cls.user] = make_users(1, prefix="author")
+        category = Category.objects.create(name="Tech")
+        for i in range(5):
+            article = Article.objects.create(
+                title=f"Article {i}", body="Body", author=cls.user, category=category
+            )
+            Comment.objects.create(article=article, comment="Nice", author=cls.user)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_profile_view(self):
+        response = self.client.get(reverse("profile", kwargs={"pk": self.user.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "registration/profile.html")
+        self.assertContains(response, "Article 4")
+        self.assertEqual(response.context["articles"][0].comment_count, 1)
+
+    def test_profile_view_query_count_is_constant(self):
+        # user, article count, one page of articles with comment counts
+        with self.assertNumQueries(3):
+            self.client.get(reverse("profile", kwargs={"pk": self.user.pk}))
+
+    @override_settings(CACHE_PROFILE_ARTICLES=True)
+    def test_profile_view_caches_article_list(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        # only the user; the article list and page come from the cache
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertContains(response, "Article 4")
+
+    @override_settings(CACHE_PROFILE_ARTICLES=True)
+    def test_profile_view_normalises_page_for_cache_key(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        # All of these render page 1, so they hit the same cached fragment
+        for page in ("1", "01", "abc", "-3", "99"):
+            with self.assertNumQueries(1):
+                response = self.client.get(url, {"page": page})
+            self.assertContains(response, "Article 4")
+
+    def test_profile_view_without_shared_cache_renders_fresh_list(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertContains(response, "Article 4")
+
+    @override_settings(CACHE_PROFILE_ARTICLES=True)
+    def test_profile_view_cache_busts_on_new_article(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        Article.objects.create(title="Fresh article", body="Body", author=self.user)
+        response = self.client.get(url)
+        self.assertContains(response, "Fresh article")
+
+    @override_settings(CACHE_PROFILE_ARTICLES=True)
+    def test_profile_view_cache_busts_on_deleted_comment(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        Comment.objects.filter(article__title="Article 4").get().delete()
+        response = self.client.get(url)
+        self.assertContains(response, "0 comments", count=1)
+        self.assertContains(response, "1 comment<", count=4)
+
+    @override_settings(CACHE_PROFILE_ARTICLES=True)
+    def test_profile_view_cache_busts_on_new_comment(self):
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        article = Article.objects.get(title="Article 4")
+        Comment.objects.create(article=article, comment="Another", author=self.user)
+        response = self.client.get(url)
+        self.assertContains(response, "2 comments", count=1)
+        self.assertContains(response, "1 comment<", count=4)
+
+    def test_cascaded_comment_deletes_skip_article_lookups(self):
+        def delete_queries(comments):
+            article = Article.objects.create(title="Doomed", body="Body", author=self.user)
+            for _ in range(comments):
+                Comment.objects.create(article=article, comment="Bye", author=self.user)
+            with CaptureQueriesContext(connection) as queries:
+                article.delete()
+            return len(queries)
+
+        self.assertEqual(delete_queries(1), delete_queries(5))
+
+    def test_profile_pages_are_stable_when_dates_tie(self):
+        for i in range(5, 25):
+            Article.objects.create(title=f"Article {i}", body="Body", author=self.user)
+        Article.objects.update(date=timezone.now())
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        seen = [
+            article.pk
+            for page in (1, 2)
+            for article in self.client.get(url, {"page": page}).context["articles"]
+        ]
+        self.assertCountEqual(seen, Article.objects.values_list("pk", flat=True))
+
+    def test_profile_view_paginates_articles(self):
+        for i in range(5, 25):
+            Article.objects.create(title=f"Article {i}", body="Body", author=self.user)
+        url = reverse("profile", kwargs={"pk": self.user.pk})
+        response = self.client.get(url)
+        self.assertEqual(len(response.context["articles"]), 20)
+        self.assertContains(response, "Article 24")
+        response = self.client.get(url, {"page": 2})
+        self.assertEqual(len(response.context["articles"]), 5)
+        self.assertContains(response, "Article 0")
+
+
+class EditProfilePageTests(TestCase):
+    def test_edit_profile_form_omits_auth_fields(self):
+        [user] = make_users(1)
+        self.client.force_login(user)
+        response = self.client.get(reverse("edit_profile"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "registration/edit_profile.html")
+        form = response.context["form"]
+        self.assertNotIn("password", form.fields)
+        self.assertNotIn("groups", form.fields)
+        self.assertNotIn("user_permissions", form.fields)
+
+    def test_edit_profile_rejects_invalid_social_link(self):
+        [user] = make_users(1)
+        self.client.force_login(user)
+        response = self.client.post(
+            reverse("edit_profile"),
+            {"username": user.username, "github_link": "not a url"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("github_link", response.context["form"].errors)
+
+
+class ProfileImageTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def upload(self, name, mode="RGB", color="red", format="JPEG"):
+        buffer = BytesIO()
+        Image.new(mode, (800, 600), color).save(buffer, format=format)
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def test_upload_generates_thumbnails(self):
+        [user] = make_users(1)
+        user.profile_image = self.upload("me.jpg")
+        user.save()
+        self.assertEqual((user.avatar_thumb.width, user.avatar_thumb.height), (128, 128))
+        self.assertEqual(user.profile_image_medium.width, 512)
+        self.assertTrue(user.avatar_url.endswith(".webp"))
+
+        user.profile_image = None
+        user.save()
+        self.assertFalse(user.avatar_thumb)
+        self.assertFalse(user.profile_image_medium)
+
+    def test_thumbnails_keep_transparency(self):
+        [user] = make_users(1)
+        user.profile_image = self.upload("me.png", "RGBA", (0, 0, 0, 0), "PNG")
+        user.save()
+        with Image.open(user.avatar_thumb) as img:
+            self.assertEqual(img.mode, "RGBA")
+            self.assertEqual(img.getpixel((0, 0))[3], 0)
+
+    def test_replacing_or_clearing_image_deletes_old_thumbnails(self):
+        [user] = make_users(1)
+        user.profile_image = self.upload("me.jpg")
+        user.save()
+        old_names = [user.avatar_thumb.name, user.profile_image_medium.name]
+        storage = user.avatar_thumb.storage
+
+        user.profile_image = self.upload("new.jpg")
+        user.save()
+        for name in old_names:
+            self.assertFalse(storage.exists(name))
+        self.assertTrue(storage.exists(user.avatar_thumb.name))
+        self.assertTrue(storage.exists(user.profile_image_medium.name))
+
+        new_names = [user.avatar_thumb.name, user.profile_image_medium.name]
+        user.profile_image = None
+        user.save()
+        for name in new_names:
+            self.assertFalse(storage.exists(name))
+
+
+# Admin pages link static files; skip the collectstatic manifest in tests.
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+)
+class CustomUserAdminTests(TestCase):
+    url = "/admin/accounts/customuser/"
+
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser(
+            username="admin",
+            email="admin@gmail.com",
+            password="testpass1234",
+        )
+        self.client.force_login(self.admin)
+        self.writer, self.reader = make_users(2)
+        for i in range(3):
+            Article.objects.create(title=f"Article {i}", body="Body", author=self.writer)
+
+    def article_counts(self, response):
+        return {
+            user.username: user._article_count
+            for user in response.context["cl"].result_list
+        }
+
+    def test_changelist_shows_article_counts(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.article_counts(response),
+            {"admin": 0, self.writer.username: 3, self.reader.username: 0},
+        )
+
+    def test_changelist_searches_by_name(self):
+        self.writer.first_name = "Roberto"
+        self.writer.save()
+        response = self.client.get(self.url, {"q": "Roberto"})
+        self.assertEqual(list(self.article_counts(response)), [self.writer.username])
+
+    def test_changelist_orders_by_article_count(self):
+        # article_count is the third list_display column
+        response = self.client.get(self.url, {"o": "-3"})
+        self.assertEqual(list(self.article_counts(response).values()), [3, 0, 0])
+        response = self.client.get(self.url, {"o": "3"})
+        self.assertEqual(list(self.article_counts(response).values()), [0, 0, 3])
+
+    def test_changelist_query_count_does_not_grow_with_users(self):
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(self.url)
+        for user in make_users(10, prefix="extra"):
+            Article.objects.create(title="Extra", body="Body", author=user)
+        with self.assertNumQueries(len(baseline)):
+            self.client.get(self.url)
@@ -1,6 +1,14 @@
+from django.conf import settings
 from django.urls import reverse_lazy, reverse
 from django.views.generic import CreateView, UpdateView, DetailView
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.functional import SimpleLazyObject
+from articles.models import Comment
+from .signals import get_profile_articles_version
 from .forms import CustomUserCreationForm, CustomUserChangeForm
 
 
@@ -26,10 +34,81 @@ class ProfileView(DetailView):
     template_name = "registration/profile.html"
     context_object_name = "profile_user"
 
+    ARTICLES_PER_PAGE = 20
+
+    def get_queryset(self):
+        # Load only the profile columns the template renders.
+        return get_user_model().objects.only(
+            "id",
+            "username",
+            "first_name",
+            "last_name",
+            "bio",
+            "profile_image",
+            "profile_image_medium",
+            "x_link",
+            "linkedin_link",
+            "github_link",
+            "website_link",
+            "date_joined",
+        )
+
+    def get_articles_queryset(self):
+        return (
+            self.object.article_set.select_related("author", "category")
+            # Skip the article body; the profile only renders a card per article.
+            .only(
+                "id",
+                "title",
+                "date",
+                "cover_image",
+                "author_id",
+                "category_id",
+                "author__username",
+                "category__name",
+            )
+            # Count comments in the same query rather than prefetching them
+            .annotate(
+                comment_count=Coalesce(
+                    Subquery(
+                        Comment.objects.filter(article=OuterRef("pk"))
+                        .order_by()
+                        .values("article")
+                        .annotate(count=Count("*"))
+                        .values("count"),
+                        output_field=IntegerField(),
+                    ),
+                    0,
+                )
+            )
+            .order_by("-date", "-pk")
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Get articles by this user
-        context["articles"] = self.object.article_set.all().order_by("-date")
+        # Paginate in the database so only one page of articles is fetched.
+        # The page is built lazily so a cached fragment skips the query.
+        try:
+            page = max(int(self.request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+        paginator = Paginator(self.get_articles_queryset(), self.ARTICLES_PER_PAGE)
+        page_obj = SimpleLazyObject(lambda: paginator.get_page(page))
+        context["page_obj"] = page_obj
+        context["articles"] = SimpleLazyObject(lambda: page_obj.object_list)
+        # The version key is only reliable when every worker shares the cache
+        context["cache_articles"] = settings.CACHE_PROFILE_ARTICLES
+        if settings.CACHE_PROFILE_ARTICLES:
+            version = get_profile_articles_version(self.object.pk)
+            # Cache the article count per version: fragment hits skip the
+            # COUNT, and out-of-range pages resolve to the last page's key.
+            paginator.count = cache.get_or_set(
+                f"profile_articles_count:{self.object.pk}:{version}",
+                lambda: paginator.count,
+                300,
+            )
+            context["is_owner"] = self.request.user == self.object
+            context["articles_version"] = version
         return context
 
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-14 05:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_article_article_date_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', '-date'], name='article_author_date_idx'),
+        ),
+    ]
@@ -13,6 +13,12 @@ class Article(models.Model):
     )
     cover_image = models.ImageField(upload_to='article_covers/', null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-date"], name="article_date_idx"),
+            models.Index(fields=["author", "-date"], name="article_author_date_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -86,7 +86,54 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {"default": env.dj_db_url("DATABASE_URL")}
+# Keep connections open between requests instead of reconnecting every time;
+# health checks discard connections the database has closed in the meantime.
+DATABASES = {
+    "default": env.dj_db_url(
+        "DATABASE_URL",
+        conn_max_age=env.int("CONN_MAX_AGE", default=60),
+        conn_health_checks=True,
+    )
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# Use Redis when REDIS_URL is set; otherwise fall back to the per-process
+# local-memory cache.
+REDIS_URL = env.str("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
+# Cache the profile article list only when the cache is shared between
+# workers; invalidation bumps a version key that every worker must see.
+CACHE_PROFILE_ARTICLES = bool(REDIS_URL)
+
+
+# Sessions
+# With a shared cache, read sessions from it and write through to the
+# database. A per-process cache would let other workers keep accepting a
+# session after logout, so keep the default database engine without one.
+if REDIS_URL:
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.0/topics/auth/passwords/
+
+# Existing PBKDF2 hashes are upgraded to Argon2 on the user's next login.
+PASSWORD_HASHERS = [
+    "accounts.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
 
 
 # Password validation
@@ -170,7 +217,23 @@ AUTH_USER_MODEL = "accounts.CustomUser"
 LOGIN_REDIRECT_URL = "home"
 LOGOUT_REDIRECT_URL = "home"
 
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Email
+# https://docs.djangoproject.com/en/5.0/topics/email/
+
+# Prints to the console unless an SMTP backend is configured.
+EMAIL_BACKEND = env.str(
+    "EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend"
+)
+EMAIL_HOST = env.str("EMAIL_HOST", default="localhost")
+EMAIL_PORT = env.int("EMAIL_PORT", default=587)
+EMAIL_HOST_USER = env.str("EMAIL_HOST_USER", default="")
+EMAIL_HOST_PASSWORD = env.str("EMAIL_HOST_PASSWORD", default="")
+EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=True)
+# Sender address for admin notifications
+SERVER_EMAIL = env.str("SERVER_EMAIL", default="root@localhost")
+
+# Recipients of contact form notifications (comma-separated emails)
+ADMINS = [("Admin", email) for email in env.list("ADMIN_EMAILS", default=[])]
 
 CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS", default=["http://localhost"])
 
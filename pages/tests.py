@@ -1,6 +1,11 @@
-from django.test import SimpleTestCase
+from unittest import mock
+
+from django.core import mail
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
+from .models import ContactSubmission
+
 
 class HomePageTests(SimpleTestCase):
     def test_url_exists_at_correct_location_homepageview(self):
@@ -12,3 +17,34 @@ class HomePageTests(SimpleTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'home.html')
         self.assertContains(response, 'Home')
+
+
+def run_inline(target, *args):
+    target(*args)
+
+
+@override_settings(ADMINS=[("Admin", "admin@gmail.com")])
+@mock.patch("pages.views.run_in_background", run_inline)
+class ContactPageTests(TestCase):
+    data = {
+        "name": "Test User",
+        "email": "testuser@gmail.com",
+        "subject": "Hello",
+        "message": "A news tip",
+    }
+
+    def test_contact_form_saves_and_notifies_admins(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("contact"), self.data)
+        self.assertRedirects(response, reverse("contact_success"))
+        self.assertEqual(ContactSubmission.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("Hello", mail.outbox[0].subject)
+
+    @mock.patch("pages.views.mail_admins", side_effect=OSError("SMTP down"))
+    def test_contact_notification_failure_is_logged(self, mail_admins):
+        with self.assertLogs("pages.views", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse("contact"), self.data)
+        self.assertRedirects(response, reverse("contact_success"))
+        self.assertEqual(ContactSubmission.objects.count(), 1)
@@ -1,10 +1,36 @@
+import logging
+import threading
+
 from django.views.generic import TemplateView, CreateView
 from django.urls import reverse_lazy
+from django.core.mail import mail_admins
+from django.db import transaction
 from .forms import ContactForm
 from .models import ContactSubmission
 from django.contrib import messages
 
 
+logger = logging.getLogger(__name__)
+
+
+def send_contact_notification(submission):
+    """Email the site admins about a new contact form submission."""
+    try:
+        mail_admins(
+            f"Contact: {submission.subject}",
+            f"From: {submission.name} <{submission.email}>\n\n{submission.message}",
+        )
+    except Exception:
+        logger.exception("Failed to send notification for contact submission %s", submission.pk)
+
+
+def run_in_background(target, *args):
+    """Run ``target(*args)`` in a daemon thread and return the thread."""
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
 class HomePageView(TemplateView):
     template_name = "home.html"
 
@@ -17,7 +43,14 @@ class ContactPageView(CreateView):
 
     def form_valid(self, form):
         messages.success(self.request, "Thank you! Your message has been sent successfully.")
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        # Send the email from a background thread once the submission is
+        # committed, so the response doesn't wait on the SMTP server.
+        submission = self.object
+        transaction.on_commit(
+            lambda: run_in_background(send_contact_notification, submission)
+        )
+        return response
 
 
 class ContactSuccessView(TemplateView):